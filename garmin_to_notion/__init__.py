@@ -0,0 +1,164 @@
+"""
+Garmin -> Notion sync
+
+Each flow pushes one kind of Garmin data into its own Notion database:
+- health     -> NOTION_HEALTH_DB_ID
+- activities -> NOTION_ACTIVITIES_DB_ID
+- steps      -> NOTION_STEPS_DB_ID
+- sleep      -> NOTION_SLEEP_DB_ID
+- records    -> NOTION_PR_DB_ID
+- legacy_activities -> NOTION_DB_ID (upstream template schema)
+
+All flows in one run share a single Notion client and a single Garmin login,
+and every flow's Garmin fetches are issued up front, concurrently, before any
+Notion writes start. The flows then push to their databases in parallel.
+
+Usage:
+    python -m garmin_to_notion                     # every flow with a DB ID set
+    python -m garmin_to_notion health activities   # only the named flows
+    python -m garmin_to_notion --force health      # ignore what earlier runs synced
+"""
+
+import json
+import argparse
+from .common import (
+    CONFIG,
+    logger,
+    make_notion_client,
+    new_garmin,
+    login_garmin,
+    forget_synced,
+    read_cached,
+    fetch_all,
+    prune_garmin_cache,
+    run_concurrently,
+)
+from . import health, activities, steps, sleep, records, legacy_activities
+
+# flow name -> (garmin_jobs, sync)
+FLOWS = {
+    "health": (health.garmin_jobs, health.sync_health),
+    "activities": (activities.garmin_jobs, activities.sync_activities),
+    "steps": (steps.garmin_jobs, steps.sync_steps),
+    "sleep": (sleep.garmin_jobs, sleep.sync_sleep),
+    "records": (records.garmin_jobs, records.sync_records),
+    "legacy_activities": (legacy_activities.garmin_jobs, legacy_activities.sync_legacy_activities),
+}
+
+# flows that record in the state file when today's page is written; the rest
+# sync a rolling window and always have to look at Garmin
+UP_TO_DATE = {
+    "health": health.up_to_date,
+    "sleep": sleep.up_to_date,
+}
+
+def _jobs(garmin, flows):
+    jobs = {}
+    for name in flows:
+        for key, job in FLOWS[name][0](garmin).items():
+            jobs[name, key] = job
+    return jobs
+
+def prefetch(garmin, flows, cached=None):
+    """
+    Run the Garmin fetches of all flows in one concurrent batch.
+
+    Jobs that already have a result in cached (as read_cached returned them)
+    are not fetched again. Returns {flow: {job name: result}}, ready to pass
+    to each flow's sync.
+    """
+    jobs = _jobs(garmin, flows)
+    prune_garmin_cache()
+    results = {key: result for key, result in (cached or {}).items() if result is not None}
+    results.update(fetch_all({key: job for key, job in jobs.items() if key not in results}))
+    fetched = {name: {} for name in flows}
+    for (name, key), result in results.items():
+        fetched[name][key] = result
+    return fetched
+
+def run_all(flows=None, force=False):
+    """
+    Log into Garmin once and run each flow against its Notion database.
+
+    With no flows given, every flow whose database ID is configured is run.
+    force drops the flows' saved sync state first, so days already marked as
+    synced are checked against Notion again.
+    Returns False if the run could not start (missing env or failed login) or
+    any flow raised.
+    """
+    if flows is None:
+        flows = [name for name in FLOWS if CONFIG.db_ids[name]]
+    missing = CONFIG.missing(flows)
+    if missing or not flows:
+        logger.error(f"Missing required environment variables ({'/'.join(missing) or 'no NOTION_*_DB_ID set'})")
+        return False
+
+    if force:
+        for name in flows:
+            forget_synced(CONFIG.db_ids[name])
+    # drop flows that are already done today before paying for the Garmin login
+    pending = [name for name in flows if not (name in UP_TO_DATE and UP_TO_DATE[name](CONFIG.db_ids[name]))]
+    if not pending:
+        logger.info("🏁 Up to date: every flow already synced today")
+        return True
+    if len(pending) < len(flows):
+        logger.info(f"⏭️ Already synced today: {', '.join(name for name in flows if name not in pending)}")
+    flows = pending
+
+    # only log in when some fetch has to go to Garmin; a rerun shortly after
+    # a full run is answered entirely from the disk cache. The responses read
+    # here are the ones the flows get, so an entry expiring before the fetch
+    # cannot send a call to Garmin without a login.
+    garmin = new_garmin()
+    cached = {key: read_cached(func, args) for key, (func, args) in _jobs(garmin, flows).items()}
+    logged_in = any(result is None for result in cached.values())
+    if logged_in:
+        try:
+            garmin = login_garmin()
+        except Exception as e:
+            logger.error(f"Failed to login to Garmin: {e}")
+            return False
+    else:
+        logger.info("Every Garmin response is cached; skipping the login")
+
+    fetched = prefetch(garmin, flows, cached)
+    notion = make_notion_client()
+    def sync(name):
+        return FLOWS[name][1](garmin, notion, CONFIG.db_ids[name], fetched[name])
+
+    summary = {}
+    ok = True
+    try:
+        # each flow writes its own database, so their Notion lookups and writes
+        # can overlap; the shared client's token bucket keeps the total rate legal
+        for name, counts, error in run_concurrently(sync, flows, max_workers=len(flows)):
+            if error is None:
+                summary[name] = dict(counts)
+            else:
+                summary[name] = {"error": str(error)}
+                ok = False
+                logger.error(f"⚠️ {name} sync failed: {error}")
+    finally:
+        # release the pooled keep-alive connections
+        notion.close()
+
+    # logout
+    if logged_in:
+        try:
+            garmin.logout()
+        except Exception:
+            pass
+    logger.info(f"🏁 Sync complete: {json.dumps(summary)}")
+    return ok
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="garmin_to_notion", description="Sync Garmin data to Notion.")
+    parser.add_argument("flows", nargs="*", metavar="flow",
+                        help=f"flows to run ({', '.join(FLOWS)}); default: every flow with a DB ID set")
+    parser.add_argument("--force", action="store_true",
+                        help="re-check days an earlier run already marked as synced")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.flows if name not in FLOWS]
+    if unknown:
+        parser.error(f"unknown flow(s): {', '.join(unknown)}")
+    return 0 if run_all(args.flows or None, force=args.force) else 1
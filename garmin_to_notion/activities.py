@@ -0,0 +1,380 @@
+"""
+Activities -> NOTION_ACTIVITIES_DB_ID (create or update)
+
+- Scans Garmin activities from the last 14 days
+- Preloads existing Notion pages and deduplicates by Garmin ID if present,
+  otherwise by Activity Name | Date | Activity Type
+- Rounded numbers, cleaned labels, proper timezone handling (America/Chicago)
+- Does NOT overwrite page icons (keeps your Notion templates/icons)
+"""
+
+import datetime
+import functools
+from collections import Counter
+from .common import (
+    LOCAL_TZ,
+    logger,
+    LazyPformat,
+    safe_fetch,
+    fetch_all,
+    run_date,
+    fetch_db_schema,
+    create_page,
+    run_concurrently,
+    extract_value,
+    KM_TO_MI,
+    km_to_miles,
+    to_float,
+    build_properties,
+    notion_title,
+    notion_text,
+    notion_date_obj_from_iso,
+    notion_number,
+    notion_select,
+)
+
+SCAN_DAYS = 14
+# per-activity fields read in one pass; activities may omit any of them,
+# so these go through dict.get rather than operator.itemgetter
+ACTIVITY_FIELDS = (
+    "distance", "duration", "averageSpeed", "calories", "trainingEffectLabel",
+    "aerobicTrainingEffectMessage", "anaerobicTrainingEffectMessage",
+)
+# fallbacks in order of preference: the start time (prefer GMT/UTC), and the
+# ID that some endpoints return as 'activityIdLocal'/'activityIdStr'/'activityPk'
+START_TIME_KEYS = ("startTimeGMT", "startTimeLocal", "startTime")
+ACTIVITY_ID_KEYS = ("activityId", "activityIdLocal", "activityIdStr", "activityPk")
+
+# ---------------------------
+# TRAINING EFFECT LABELS
+# ---------------------------
+TRAINING_LABELS = {
+    "IMPROVING": "Improving",
+    "IMPACTING": "Impacting",
+    "HIGHLY_IMPACTING": "Highly Impacting",
+    "MAINTAINING": "Maintaining",
+    "RECOVERY": "Recovery",
+    "NO_BENEFIT": "No Benefit",
+    "NO_AEROBIC_BENEFIT": "No Benefit",
+    "MINOR": "Some Benefit",
+    "OVERREACHING": "Overreaching",
+    "STRAINED": "Strained"
+}
+
+@functools.lru_cache(maxsize=128)
+def clean_training_label(label):
+    # Garmin only ever sends a handful of distinct labels, so results are cached
+    if not label:
+        return None
+    s = str(label).upper()
+    for k, v in TRAINING_LABELS.items():
+        if k in s:
+            return v
+    return s.replace("_", " ").title()
+
+# ---------------------------
+# HELPERS
+# ---------------------------
+def parse_garmin_local_dt(dt_str):
+    """Return an aware LOCAL_TZ datetime from various Garmin formats (naive values are UTC)."""
+    if not dt_str:
+        return None
+    s = str(dt_str).strip()
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
+    # Garmin's usual "YYYY-MM-DD HH:MM:SS" / ISO values parse in one pass
+    try:
+        dt = datetime.datetime.fromisoformat(s)
+    except ValueError:
+        dt = None
+    if dt is None:
+        # fallback formats
+        for f in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
+            try:
+                dt = datetime.datetime.strptime(s, f)
+                break
+            except ValueError:
+                continue
+        else:
+            logger.debug("parse_garmin_local_dt could not parse %r", dt_str)
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=datetime.timezone.utc)
+    return dt.astimezone(LOCAL_TZ)
+
+def parse_garmin_datetime(dt_str):
+    """Return a local ISO timestamp string (with offset) from various Garmin formats."""
+    dt = parse_garmin_local_dt(dt_str)
+    return dt.isoformat() if dt else None
+
+# ---------------------------
+# Activity formatting helpers
+# ---------------------------
+ACTIVITY_TYPE_MAPPING = {
+    "Barre": "Strength",
+    "Indoor Cardio": "Cardio",
+    "Indoor Cycling": "Cycling",
+    "Indoor Rowing": "Rowing",
+    "Speed Walking": "Walking",
+    "Strength Training": "Strength",
+    "Treadmill Running": "Running"
+}
+
+def format_activity_type(activity_type, activity_name=""):
+    if isinstance(activity_type, dict):
+        activity_type = activity_type.get("typeKey") or activity_type.get("type") or ""
+    if not activity_type:
+        formatted = "Unknown"
+    else:
+        formatted = str(activity_type).replace("_", " ").title()
+    subtype = formatted
+    main = ACTIVITY_TYPE_MAPPING.get(formatted, formatted)
+    # name-based overrides
+    name = activity_name.lower() if activity_name else ""
+    if "meditation" in name:
+        return "Meditation", "Meditation"
+    if "barre" in name:
+        return "Strength", "Barre"
+    if "stretch" in name:
+        return "Stretching", "Stretching"
+    return main, subtype
+
+def _format_pace(pace_min, unit):
+    m, s = divmod(int(round(pace_min * 60)), 60)
+    return f"{m}:{s:02d} min/{unit}"
+
+def compute_paces(average_speed_mps, duration_min, distance_km):
+    # one min/km figure from speed (preferred) or duration/distance; min/mi derives from it
+    if average_speed_mps and average_speed_mps > 0:
+        pace_min_per_km = 1000 / (average_speed_mps * 60)
+    elif distance_km and distance_km > 0 and duration_min and duration_min > 0:
+        pace_min_per_km = duration_min / distance_km
+    else:
+        return None, None
+    return _format_pace(pace_min_per_km, "km"), _format_pace(pace_min_per_km / KM_TO_MI, "mi")
+
+# ---------------------------
+# Build props
+# ---------------------------
+def build_activity_properties(act_iso, activity_name, distance_km, duration_min,
+                              avg_pace_km_text, avg_pace_mi_text, calories,
+                              activity_type, sub_activity_type,
+                              ae_effect, an_effect, training_effect_label,
+                              aerobic_msg, anaerobic_msg):
+    ae_val = to_float(ae_effect)
+    an_val = to_float(an_effect)
+    ae_val = round(ae_val, 1) if ae_val is not None else None
+    an_val = round(an_val, 1) if an_val is not None else None
+    ratio = round(ae_val / an_val, 2) if ae_val is not None and an_val else None
+    dist_km_r = round(distance_km, 2) if distance_km is not None else None
+    dist_mi_r = km_to_miles(distance_km) if distance_km is not None else None
+    dur_r = round(duration_min, 2) if duration_min is not None else None
+
+    return build_properties((
+        ("Activity Name", notion_title, activity_name),
+        ("Date", notion_date_obj_from_iso, act_iso),
+        ("Distance (km)", notion_number, dist_km_r),
+        ("Distance (mi)", notion_number, dist_mi_r),
+        ("Duration (mins)", notion_number, dur_r),
+        ("Avg Pace (min/km)", notion_text, avg_pace_km_text),
+        ("Avg Pace (min/mi)", notion_text, avg_pace_mi_text),
+        ("Calories", notion_number, calories),
+        ("Activity Type", notion_select, activity_type),
+        ("Subactivity Type", notion_select, sub_activity_type),
+        ("Training Effect", notion_select, clean_training_label(training_effect_label)),
+        ("Aerobic", notion_number, ae_val),
+        ("Aerobic Effect", notion_select, clean_training_label(aerobic_msg)),
+        ("Anaerobic", notion_number, an_val),
+        ("Anaerobic Effect", notion_select, clean_training_label(anaerobic_msg)),
+        ("AE:AN", notion_number, ratio),
+    ))
+
+# ---------------------------
+# Notion preload & helpers
+# ---------------------------
+def preload_existing_activities(notion_client, db_id, on_or_after=None):
+    """
+    Paginate through the Notion DB (only pages dated on_or_after or later, if
+    given) and build:
+     - existing_by_garmin_id: dict mapping garmin_id -> page_id (if Garmin ID property exists)
+     - existing_by_key: dict mapping "name|date|type" -> page_id (fallback)
+     - db_has_garmin_id: bool whether the DB has a 'Garmin ID' property
+    """
+    existing_by_garmin_id = {}
+    existing_by_key = {}
+    db_has_garmin_id = False
+    prop_keys_seen = set()
+
+    date_filter = {"filter": {"property": "Date", "date": {"on_or_after": on_or_after}}} if on_or_after else {}
+    start_cursor = None
+    total_loaded = 0
+    try:
+        while True:
+            q = notion_client.databases.query(database_id=db_id, start_cursor=start_cursor, page_size=100, **date_filter)
+            for r in q.get("results", []):
+                total_loaded += 1
+                props = r.get("properties", {})
+                prop_keys_seen.update(props.keys())
+                # glean values safely
+                # Garmin ID if present (number or text)
+                garmin_id_val = None
+                if "Garmin ID" in props:
+                    # support number or rich_text/text
+                    g = props["Garmin ID"]
+                    # try number
+                    if g.get("number") is not None:
+                        garmin_id_val = str(g.get("number"))
+                    # try text / rich_text
+                    elif g.get("rich_text"):
+                        garmin_id_val = "".join([t.get("text", {}).get("content", "") for t in g.get("rich_text", [])]) or None
+                    elif g.get("title"):
+                        garmin_id_val = "".join([t.get("plain_text", "") for t in g.get("title", [])]) or None
+
+                # build fallback key
+                name = ""
+                try:
+                    name = props.get("Activity Name", {}).get("title", [{}])[0].get("plain_text", "") or ""
+                except Exception:
+                    name = ""
+                date_raw = props.get("Date", {}).get("date", {}).get("start", "") or ""
+                type_name = props.get("Activity Type", {}).get("select", {}).get("name", "") or ""
+                key = f"{name}|{date_raw[:10]}|{type_name}"
+                if garmin_id_val:
+                    existing_by_garmin_id[garmin_id_val] = r["id"]
+                    db_has_garmin_id = True
+                existing_by_key[key] = r["id"]
+
+            start_cursor = q.get("next_cursor")
+            if not q.get("has_more"):
+                break
+    except Exception as e:
+        logger.warning(f"⚠️ Error preloading Notion activities: {e}")
+    logger.info(f"Preloaded {total_loaded} Notion activities (Garmin ID property present: {db_has_garmin_id})")
+    return existing_by_garmin_id, existing_by_key, db_has_garmin_id
+
+def find_existing_activity_page(notion_client, db_id, garmin_id, name, date_only, act_type, existing_by_garmin_id, existing_by_key, db_has_garmin_id):
+    """Return the matching page_id if present using either Garmin ID or fallback key."""
+    # check Garmin ID first if db supports it
+    if db_has_garmin_id and garmin_id:
+        pid = existing_by_garmin_id.get(str(garmin_id))
+        if pid:
+            return pid
+    # fallback to name|date|type key
+    key = f"{name}|{date_only}|{act_type}"
+    return existing_by_key.get(key)
+
+# ---------------------------
+# SYNC
+# ---------------------------
+def scan_cutoff():
+    """Oldest local date the activities scan covers."""
+    return run_date() - datetime.timedelta(days=SCAN_DAYS)
+
+def garmin_jobs(garmin):
+    # ask Garmin for the scan window only (a day early for time zone slack)
+    # rather than the latest few hundred activities; the end date is tomorrow
+    # so the window stays open and its cached response is treated as recent
+    cutoff = scan_cutoff()
+    end = run_date() + datetime.timedelta(days=1)
+    start = cutoff - datetime.timedelta(days=1)
+    return {"activities": (garmin.get_activities_by_date, (start.isoformat(), end.isoformat()))}
+
+def sync_activities(garmin, notion, database_id, fetched=None):
+    # ---------------------------
+    # ACTIVITIES: safer scan (last 14 days) + dedupe via Garmin ID or fallback key
+    # ---------------------------
+    logger.info("Syncing activities (last 14 days, safe mode)...")
+
+    # compute cutoff date (14 days ago)
+    cutoff = scan_cutoff()
+    logger.debug("Cutoff date for scan: %s", cutoff)
+
+    # fetch recent activities from Garmin (batch) and filter by cutoff
+    results = fetched if fetched is not None else fetch_all(garmin_jobs(garmin))
+    activities = results["activities"] or []
+    logger.info(f"Fetched {len(activities)} activities from Garmin (batch)")
+
+    candidates = []
+    for act in activities:
+        raw_ts = next(filter(None, map(act.get, START_TIME_KEYS)), None)
+        local_dt = parse_garmin_local_dt(raw_ts)
+        if not local_dt or local_dt.date() < cutoff:
+            continue
+        candidates.append((act, local_dt.isoformat(), local_dt.date().isoformat()))
+
+    logger.info(f"Found {len(candidates)} candidate activities in the last 14 days")
+    if not candidates:
+        # nothing to write, so no need to look at Notion at all
+        return Counter()
+
+    # preload existing notion activities; only the scanned window can match, and
+    # a day of slack covers pages whose Date was written in another time zone
+    window_start = (cutoff - datetime.timedelta(days=1)).isoformat()
+    existing_by_garmin_id, existing_by_key, db_has_garmin_id = preload_existing_activities(notion, database_id, window_start)
+    # the schema knows about an empty 'Garmin ID' column even before any page has a value
+    schema = safe_fetch(fetch_db_schema, notion, database_id) or {}
+    db_has_garmin_id = db_has_garmin_id or "Garmin ID" in schema
+
+    # iterate candidates and create/update with robust dedupe
+    created = 0
+    updated = 0
+    failed = 0
+    writes = []  # (page_id or None, props, name, date_only)
+    for act, parsed_iso, date_only in candidates:
+        # get details
+        name = act.get("activityName") or f"Activity {date_only}"
+        garmin_id = next(filter(None, map(act.get, ACTIVITY_ID_KEYS)), None)
+        # normalize to string when checking
+        if garmin_id is not None:
+            garmin_id = str(garmin_id)
+
+        raw_type = act.get("activityType") or ""
+        act_type, subactivity = format_activity_type(raw_type, name)
+        (distance, duration, avg_speed, calories, training_effect_label,
+         aerobic_msg, anaerobic_msg) = map(act.get, ACTIVITY_FIELDS)
+        # distance/duration
+        distance = to_float(distance)
+        duration = to_float(duration)
+        distance_km = distance / 1000.0 if distance is not None else None
+        duration_min = round(duration / 60.0, 2) if duration is not None else None
+        avg_speed = to_float(avg_speed)
+        avg_pace_km_text, avg_pace_mi_text = compute_paces(avg_speed, duration_min, distance_km)
+        calories = calories or None
+        ae_effect = act.get("aerobicTrainingEffect") or extract_value(act, ["aeEffect"]) or None
+        an_effect = act.get("anaerobicTrainingEffect") or extract_value(act, ["anEffect"]) or None
+
+        props = build_activity_properties(parsed_iso, name, distance_km, duration_min, avg_pace_km_text, avg_pace_mi_text, calories, act_type, subactivity, ae_effect, an_effect, training_effect_label, aerobic_msg, anaerobic_msg)
+
+        # check if exists
+        page_id = find_existing_activity_page(notion, database_id, garmin_id, name, date_only, act_type, existing_by_garmin_id, existing_by_key, db_has_garmin_id)
+        # If DB supports Garmin ID property, include it in new pages (only if property exists)
+        if not page_id and db_has_garmin_id and garmin_id:
+            props["Garmin ID"] = notion_text(garmin_id)
+        writes.append((page_id, props, name, date_only))
+
+    # push all writes concurrently (bounded to Notion's rate limit)
+    def push(write):
+        page_id, props = write[0], write[1]
+        if page_id:
+            notion.pages.update(page_id=page_id, properties=props)
+        else:
+            create_page(notion, database_id, props)
+
+    for (page_id, props, name, date_only), _, error in run_concurrently(push, writes):
+        if page_id:
+            if error is None:
+                updated += 1
+                logger.info(f"🔁 Updated existing activity: {name} ({date_only})")
+            else:
+                failed += 1
+                logger.warning(f"⚠️ Failed to update activity {name}: {error}")
+        elif error is None:
+            created += 1
+            logger.info(f"✅ Created activity: {name} ({date_only})")
+        else:
+            failed += 1
+            logger.warning(f"⚠️ Failed to create activity {name}: {error}")
+            logger.debug("%s", LazyPformat(props))
+
+    logger.info(f"Activities result: created={created}, updated={updated}, failed={failed}")
+    return +Counter(created=created, updated=updated, failed=failed)
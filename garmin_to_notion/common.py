@@ -0,0 +1,664 @@
+"""
+Shared configuration, clients and helpers for the Garmin -> Notion flows.
+
+Everything that used to be copy-pasted at the top of each sync script lives
+here: environment, logging, Notion/Garmin client construction and the small
+Notion property builders.
+"""
+
+import os
+import re
+import json
+import time
+import datetime
+import logging
+import functools
+import inspect
+import pprint
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+import httpx
+from notion_client import Client, APIErrorCode, APIResponseError
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
+from garminconnect import Garmin
+import pytz
+from dotenv import load_dotenv
+try:
+    import orjson  # optional: faster JSON for Notion request/response bodies
+except ImportError:
+    orjson = None
+
+# ---------------------------
+# CONFIG
+# ---------------------------
+load_dotenv()
+_TRUTHY = frozenset({"1", "true", "yes"})
+DEBUG = os.getenv("DEBUG", "").lower() in _TRUTHY
+LOCAL_TZ = pytz.timezone("America/Chicago")
+NOTION_TIMEOUT_MS = 30_000
+NOTION_MAX_CONNECTIONS = 8
+GARMIN_FETCH_WORKERS = 8  # also the size of garth's requests connection pool
+GARMIN_RETRY_STATUSES = (408, 429, 500, 502, 503, 504)  # garth's defaults plus 429
+GARMIN_FETCH_TIMEOUT = 60  # seconds for a whole fetch_all batch; a hung endpoint yields None
+NOTION_CONCURRENCY = 3
+NOTION_RATE_LIMIT = 3  # Notion allows an average of 3 requests/second per integration
+NOTION_MAX_RETRIES = 5
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "garmin_to_notion")
+SCHEMA_CACHE_TTL = 86400  # Notion DB schemas almost never change between daily runs
+GARMIN_CACHE_TTL = 6 * 3600  # calls about past days; their data has settled
+GARMIN_RECENT_CACHE_TTL = 15 * 60  # everything else; only spares back-to-back reruns
+STATE_PATH = os.path.join(CACHE_DIR, "state.json")
+GARMIN_TOKENSTORE = os.path.expanduser(os.getenv("GARMIN_TOKENSTORE") or "~/.garminconnect")
+
+# ---------------------------
+# ENV
+# ---------------------------
+# flow name -> env var holding that flow's Notion database ID
+NOTION_DB_ENV = {
+    "health": "NOTION_HEALTH_DB_ID",
+    "activities": "NOTION_ACTIVITIES_DB_ID",
+    "steps": "NOTION_STEPS_DB_ID",
+    "sleep": "NOTION_SLEEP_DB_ID",
+    "records": "NOTION_PR_DB_ID",
+    "legacy_activities": "NOTION_DB_ID",
+}
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Environment read once at import; run_all checks missing() before any network call."""
+    garmin_username: str | None
+    garmin_password: str | None
+    garmin_tokens: str | None  # garth.dumps() output, an alternative to the token directory
+    notion_token: str | None
+    db_ids: dict  # flow name -> Notion database ID or None
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            # the upstream scripts used GARMIN_EMAIL; accept it as an alias
+            garmin_username=os.getenv("GARMIN_USERNAME") or os.getenv("GARMIN_EMAIL"),
+            garmin_password=os.getenv("GARMIN_PASSWORD"),
+            garmin_tokens=os.getenv("GARMIN_TOKENS"),
+            notion_token=os.getenv("NOTION_TOKEN"),
+            db_ids={flow: os.getenv(var) for flow, var in NOTION_DB_ENV.items()},
+        )
+
+    def missing(self, flows):
+        """Names of the env vars that running flows needs but are unset."""
+        required = [("NOTION_TOKEN", self.notion_token)]
+        # saved tokens resume the session; the password is only needed for a fresh SSO login
+        if not (self.garmin_tokens or os.path.isdir(GARMIN_TOKENSTORE)):
+            required += [("GARMIN_USERNAME", self.garmin_username), ("GARMIN_PASSWORD", self.garmin_password)]
+        missing = [var for var, value in required if not value]
+        return missing + [NOTION_DB_ENV[flow] for flow in flows if not self.db_ids[flow]]
+
+CONFIG = Config.from_env()
+
+# ---------------------------
+# LOGGING
+# ---------------------------
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger("garmin_to_notion")
+# LOG_LEVEL=WARNING keeps scheduled runs down to problems only
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+if DEBUG:
+    logger.setLevel(logging.DEBUG)
+elif LOG_LEVEL in logging.getLevelNamesMapping():
+    logger.setLevel(LOG_LEVEL)
+else:
+    logger.setLevel(logging.INFO)
+    logger.warning(f"⚠️ Unknown LOG_LEVEL {LOG_LEVEL!r}; logging at INFO")
+
+class LazyPformat:
+    """Log argument that pretty-prints obj only if the record is actually emitted."""
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self):
+        return pprint.pformat(self.obj)
+
+# ---------------------------
+# CLIENTS
+# ---------------------------
+class TokenBucket:
+    """Thread-safe token bucket: allows bursts of `rate` calls, `rate` per second on average."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0
+        if delay:
+            time.sleep(delay)
+
+def _backoff(attempt):
+    # jittered so workers throttled together don't all retry in the same instant
+    return 2 ** attempt + random.random()
+
+def _retry_delay(error, attempt, method, path):
+    """Seconds to wait before retrying a Notion call, or None if it should not be retried."""
+    # a page create that timed out or got a 5xx may still have gone through, and
+    # repeating it would add a duplicate row; only a 429 is known to be rejected
+    creates_page = method == "POST" and path == "pages"
+    if not isinstance(error, HTTPResponseError):
+        # a connect error never reached Notion
+        if isinstance(error, RequestTimeoutError) and creates_page:
+            return None
+        return _backoff(attempt)
+    if error.status != 429 and (error.status < 500 or creates_page):
+        return None
+    try:
+        return float(error.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return _backoff(attempt)
+
+class NotionClient(Client):
+    """
+    notion_client.Client that stays under Notion's rate limit.
+
+    Every request takes a token from a shared bucket, and 429/5xx responses,
+    connect errors and timeouts are retried with jittered exponential backoff
+    (or Notion's Retry-After); page creates only on 429 and connect errors, as
+    they may already have landed. Bodies are encoded/decoded with orjson when
+    it is installed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bucket = TokenBucket(NOTION_RATE_LIMIT)
+
+    def request(self, path, method, *args, **kwargs):
+        for attempt in range(NOTION_MAX_RETRIES):
+            self.bucket.acquire()
+            try:
+                return super().request(path, method, *args, **kwargs)
+            except (HTTPResponseError, httpx.ConnectError, RequestTimeoutError) as e:
+                delay = _retry_delay(e, attempt, method, path)
+                if delay is None or attempt == NOTION_MAX_RETRIES - 1:
+                    raise
+                reason = f"returned {e.status}" if isinstance(e, HTTPResponseError) else f"failed ({type(e).__name__})"
+                logger.warning(f"⚠️ Notion {reason}; retrying in {delay:.0f}s")
+                time.sleep(delay)
+
+    def _build_request(self, method, path, query=None, body=None, auth=None):
+        if orjson is None or body is None:
+            return super()._build_request(method, path, query, body, auth)
+        headers = {"Content-Type": "application/json"}
+        if auth:
+            headers["Authorization"] = f"Bearer {auth}"
+        return self.client.build_request(method, path, params=query, content=orjson.dumps(body), headers=headers)
+
+    def _parse_response(self, response):
+        if orjson is None or not response.is_success:
+            return super()._parse_response(response)
+        return orjson.loads(response.content)
+
+def make_notion_client():
+    """
+    Build the Notion client shared by every flow in this process.
+
+    Notion is a single host, so one pooled HTTP/2 connection is kept alive and
+    reused (and multiplexed) by every query/create instead of a TLS handshake
+    per request.
+    """
+    http = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=NOTION_MAX_CONNECTIONS,
+                            max_keepalive_connections=NOTION_MAX_CONNECTIONS),
+    )
+    return NotionClient(auth=CONFIG.notion_token, client=http, timeout_ms=NOTION_TIMEOUT_MS)
+
+def new_garmin():
+    """A Garmin client that is not logged in yet (no network traffic)."""
+    garmin = Garmin(CONFIG.garmin_username, CONFIG.garmin_password)
+    # one pooled keep-alive connection per fetch worker, so concurrent fetches
+    # never open (and then discard) connections beyond the pool; a burst of
+    # concurrent fetches can be throttled, so 429s are retried (honouring
+    # Retry-After) like the 5xx statuses garth already retries
+    garmin.garth.configure(pool_connections=GARMIN_FETCH_WORKERS, pool_maxsize=GARMIN_FETCH_WORKERS,
+                           status_forcelist=GARMIN_RETRY_STATUSES)
+    return garmin
+
+def login_garmin():
+    """
+    Log into Garmin Connect once; raises if the login fails.
+
+    The garth OAuth tokens are kept in GARMIN_TOKENSTORE, so a run normally
+    resumes the saved session (garth refreshes an expired access token on its
+    own). Next it tries a garth.dumps() string from GARMIN_TOKENS, which
+    survives CI cache eviction, and only falls back to the full SSO login
+    when neither is usable.
+    """
+    sources = [GARMIN_TOKENSTORE] + ([CONFIG.garmin_tokens] if CONFIG.garmin_tokens else [])
+    for tokens in sources:
+        garmin = new_garmin()
+        try:
+            garmin.login(tokens)
+            logger.info("Resumed Garmin session from saved tokens")
+            break
+        except Exception as e:
+            logger.debug("Saved Garmin tokens unusable (%s)", e)
+    else:
+        garmin = new_garmin()
+        logger.info("Logging into Garmin...")
+        garmin.login()
+    try:
+        # re-save every run so a refreshed access token is kept too
+        garmin.garth.dump(GARMIN_TOKENSTORE)
+    except OSError as e:
+        logger.debug("Could not save Garmin tokens to %s: %s", GARMIN_TOKENSTORE, e)
+    return garmin
+
+@functools.lru_cache(maxsize=None)
+def run_date():
+    """Today in LOCAL_TZ, read once so every flow in a run agrees on it even across midnight."""
+    return datetime.datetime.now(tz=LOCAL_TZ).date()
+
+@functools.lru_cache(maxsize=None)
+def _takes_end_date(func):
+    return len(inspect.signature(func).parameters) > 2  # self, start[, end]
+
+def day_args(method, day):
+    """
+    Arguments for asking a Garmin method about a single day.
+
+    Range endpoints take (start, end) in some garminconnect releases and only
+    a start date in others; the installed signature is inspected once per
+    method instead of guessing at every call site.
+    """
+    return (day, day) if _takes_end_date(method.__func__) else (day,)
+
+# ---------------------------
+# DISK CACHE
+# ---------------------------
+def _read_cache(path, ttl):
+    """Cached JSON at path if it is younger than ttl seconds, else None."""
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _write_cache(path, obj):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f)
+    except OSError as e:
+        logger.debug("Could not write cache %s: %s", path, e)
+
+def disk_cache(prefix, ttl):
+    """
+    Cache the JSON result of func(notion, key) in CACHE_DIR for ttl seconds.
+
+    Results are also kept in memory, so repeated lookups within a run are a
+    dict hit rather than a file read. The wrapped function gains an
+    invalidate(key) method to drop a stale entry from both, cached(key) to
+    look without calling func, and a fresh set of the keys func was called
+    for in this process.
+    """
+    def decorator(func):
+        memo = {}
+        fresh = set()
+
+        def path_for(key):
+            return os.path.join(CACHE_DIR, f"{prefix}-{key}.json")
+
+        @functools.wraps(func)
+        def wrapper(notion, key):
+            if key in memo:
+                return memo[key]
+            path = path_for(key)
+            result = _read_cache(path, ttl)
+            if result is None:
+                result = func(notion, key)
+                fresh.add(key)
+                _write_cache(path, result)
+            memo[key] = result
+            return result
+
+        def cached(key):
+            if key in memo:
+                return memo[key]
+            return _read_cache(path_for(key), ttl)
+
+        def invalidate(key):
+            memo.pop(key, None)
+            try:
+                os.remove(path_for(key))
+            except OSError:
+                pass
+
+        wrapper.invalidate = invalidate
+        wrapper.cached = cached
+        wrapper.fresh = fresh
+        return wrapper
+    return decorator
+
+# ---------------------------
+# LOCAL STATE
+# ---------------------------
+_state = None
+_state_lock = threading.Lock()
+
+def _load_state():
+    global _state
+    if _state is None:
+        try:
+            with open(STATE_PATH, encoding="utf-8") as f:
+                _state = json.load(f)
+        except (OSError, ValueError):
+            _state = {}
+    return _state
+
+def last_synced(database_id):
+    """Date string of the last page this machine wrote to database_id, if any."""
+    with _state_lock:
+        return _load_state().get(database_id)
+
+def mark_synced(database_id, date_str):
+    """Remember that database_id has its page for date_str, so later runs can skip the lookup."""
+    with _state_lock:
+        state = _load_state()
+        if state.get(database_id) == date_str:
+            return
+        state[database_id] = date_str
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(STATE_PATH, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+        except OSError as e:
+            logger.debug("Could not write state %s: %s", STATE_PATH, e)
+
+def forget_synced(database_id):
+    """Drop database_id from the state, so the next sync looks at Notion again."""
+    with _state_lock:
+        state = _load_state()
+        if state.pop(database_id, None) is None:
+            return
+        try:
+            with open(STATE_PATH, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+        except OSError as e:
+            logger.debug("Could not write state %s: %s", STATE_PATH, e)
+
+# ---------------------------
+# NOTION SCHEMA
+# ---------------------------
+@disk_cache("schema", ttl=SCHEMA_CACHE_TTL)
+def fetch_db_schema(notion, database_id):
+    """Return {property name: property type} for a Notion database."""
+    db = notion.databases.retrieve(database_id=database_id)
+    return {name: prop.get("type") for name, prop in db.get("properties", {}).items()}
+
+def create_page(notion, database_id, properties, **kwargs):
+    """
+    Create a page in database_id.
+
+    Properties the cached schema does not know are dropped up front (after
+    one schema refresh per run, in case the column was just added), so a
+    database missing a column does not cost a rejected create on every run.
+    On a validation error the cached schema is refreshed and the create is
+    retried once with only the properties the database actually has.
+    """
+    schema = fetch_db_schema.cached(database_id)
+    if schema is not None and not properties.keys() <= schema.keys():
+        if database_id not in fetch_db_schema.fresh:
+            fetch_db_schema.invalidate(database_id)
+            schema = safe_fetch(fetch_db_schema, notion, database_id) or {}
+        known = {k: v for k, v in properties.items() if k in schema}
+        if schema and len(known) < len(properties):
+            logger.warning(f"⚠️ Dropping properties not in Notion schema: {sorted(set(properties) - set(known))}")
+            properties = known
+    try:
+        return notion.pages.create(parent={"database_id": database_id}, properties=properties, **kwargs)
+    except APIResponseError as e:
+        if e.code != APIErrorCode.ValidationError:
+            raise
+        fetch_db_schema.invalidate(database_id)
+        schema = fetch_db_schema(notion, database_id)
+        known = {k: v for k, v in properties.items() if k in schema}
+        if len(known) == len(properties):
+            raise
+        logger.warning(f"⚠️ Dropping properties not in Notion schema: {sorted(set(properties) - set(known))}")
+        return notion.pages.create(parent={"database_id": database_id}, properties=known, **kwargs)
+
+def pages_by_date(notion, database_id, on_or_after, date_prop="Date", extra_filter=None):
+    """
+    Return {YYYY-MM-DD: page} for every page dated on_or_after or later.
+
+    One paginated query per database replaces a per-row "does this date exist"
+    lookup; callers then check membership locally.
+    """
+    date_filter = {"property": date_prop, "date": {"on_or_after": on_or_after}}
+    query_filter = {"and": [date_filter, extra_filter]} if extra_filter else date_filter
+    pages = {}
+    start_cursor = None
+    while True:
+        kwargs = {"start_cursor": start_cursor} if start_cursor else {}
+        q = notion.databases.query(database_id=database_id, filter=query_filter, page_size=100, **kwargs)
+        for page in q.get("results", []):
+            start = ((page.get("properties", {}).get(date_prop) or {}).get("date") or {}).get("start")
+            if start:
+                pages.setdefault(start[:10], page)
+        if not q.get("has_more"):
+            return pages
+        start_cursor = q.get("next_cursor")
+
+def missing_properties(page, properties):
+    """The subset of properties that the existing Notion page has no value for."""
+    current = page.get("properties", {})
+    missing = {}
+    for name, prop in properties.items():
+        have = current.get(name)
+        if have is None or have.get(have.get("type")) in (None, [], ""):
+            missing[name] = prop
+    return missing
+
+def run_concurrently(func, items, max_workers=NOTION_CONCURRENCY):
+    """
+    Call func(item) for every item on a small thread pool.
+
+    Used for Notion writes: the shared HTTP/2 client multiplexes the in-flight
+    requests over one connection. Returns (item, result, error) tuples in input
+    order; a failing call does not stop the others.
+    """
+    def call(item):
+        try:
+            return item, func(item), None
+        except Exception as e:
+            return item, None, e
+
+    if len(items) <= 1:
+        return [call(item) for item in items]
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(call, items))
+
+# ---------------------------
+# HELPERS
+# ---------------------------
+def safe_fetch(func, *args, **kwargs):
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        logger.warning(f"⚠️ Garmin API error ({getattr(func,'__name__', func)}): {e}")
+        return None
+
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+
+def _garmin_cache_entry(func, args):
+    """(cache file, ttl) for a Garmin call; past-day calls are kept far longer than the rest."""
+    path = os.path.join(CACHE_DIR, f"garmin-{func.__name__}-{'_'.join(map(str, args))}.json")
+    dates = [a for a in args if isinstance(a, str) and _ISO_DATE.match(a)]
+    if dates and max(dates) < run_date().isoformat():
+        return path, GARMIN_CACHE_TTL
+    return path, GARMIN_RECENT_CACHE_TTL
+
+def read_cached(func, args):
+    """The disk-cached response to a Garmin call, or None if cached_fetch would have to fetch it."""
+    return _read_cache(*_garmin_cache_entry(func, args))
+
+def cached_fetch(func, *args):
+    """
+    safe_fetch with a disk cache of Garmin responses.
+
+    Calls whose date arguments are all in the past are reused for hours, so
+    repeat runs on the same day (e.g. an hourly cron) skip yesterday's
+    summaries. Anything else (today, activities, records) is only reused for
+    a few minutes, enough for a manual rerun not to hit Garmin again.
+    """
+    result = read_cached(func, args)
+    if result is not None:
+        return result
+    result = safe_fetch(func, *args)
+    if result is not None:
+        _write_cache(_garmin_cache_entry(func, args)[0], result)
+    return result
+
+def prune_garmin_cache():
+    """Delete cached Garmin responses too old to be used again."""
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+    cutoff = time.time() - GARMIN_CACHE_TTL
+    for name in names:
+        if name.startswith("garmin-"):
+            path = os.path.join(CACHE_DIR, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+
+def fetch_all(jobs):
+    """
+    Run independent Garmin fetches concurrently.
+
+    jobs maps a result name to (func, args). Every call goes through
+    cached_fetch, so a failing endpoint yields None without affecting the rest.
+    Calls still running after GARMIN_FETCH_TIMEOUT are abandoned and also
+    yield None, so one hung endpoint cannot stall the run. Identical calls
+    (same endpoint and arguments, e.g. yesterday's steps for both the health
+    and steps flows) are only sent once and share the result.
+    """
+    ex = ThreadPoolExecutor(max_workers=GARMIN_FETCH_WORKERS)
+    calls = {}
+    for func, args in jobs.values():
+        if (func, args) not in calls:
+            calls[func, args] = ex.submit(cached_fetch, func, *args)
+    futures = {name: calls[job] for name, job in jobs.items()}
+    done, _ = wait(calls.values(), timeout=GARMIN_FETCH_TIMEOUT)
+    ex.shutdown(wait=False, cancel_futures=True)
+    results = {}
+    for name, future in futures.items():
+        if future in done:
+            results[name] = future.result()
+        else:
+            logger.warning(f"⚠️ Garmin API timeout ({name}) after {GARMIN_FETCH_TIMEOUT}s")
+            results[name] = None
+    return results
+
+KM_TO_MI = 0.621371
+GRAMS_PER_LB = 453.592
+
+_HUNDREDTH_MI_PER_KM = KM_TO_MI * 100
+
+def km_to_miles(km):
+    # hundredths of a mile, rounded half up, without a round() call
+    return int(km * _HUNDREDTH_MI_PER_KM + 0.5) / 100
+
+def notion_date_obj_from_iso(iso_str):
+    if not iso_str:
+        return None
+    return {"date": {"start": iso_str}}
+
+def to_float(value):
+    """float(value) for numbers and numeric strings, otherwise None."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+def notion_number(value):
+    # most values already arrive as int/float; only strings need converting
+    t = type(value)
+    if t is int:
+        return {"number": value} if value else None
+    v = value if t is float else to_float(value)
+    if not v:
+        return None
+    return {"number": round(v, 2)}
+
+def _as_str(value):
+    return value if isinstance(value, str) else str(value)
+
+def notion_select(name):
+    if name is None:
+        return None
+    return {"select": {"name": _as_str(name)}}
+
+def notion_title(text):
+    return {"title": [{"text": {"content": _as_str(text)}}]}
+
+def notion_text(value):
+    if value is None or value == "":
+        return None
+    return {"rich_text": [{"text": {"content": _as_str(value)}}]}
+
+def build_properties(fields):
+    """
+    Build a Notion properties dict from (name, builder, value) triples.
+
+    Fields whose value is None are skipped before their builder runs, and
+    builders returning None (e.g. zero numbers) are left out of the payload.
+    """
+    props = {}
+    for name, builder, value in fields:
+        if value is None:
+            continue
+        prop = builder(value)
+        if prop is not None:
+            props[name] = prop
+    return props
+
+def extract_value(data, keys):
+    if not data:
+        return None
+    if isinstance(data, dict):
+        for k in keys:
+            if k in data:
+                val = data[k]
+                if isinstance(val, (int, float, str)):
+                    return val
+                res = extract_value(val, keys)
+                if res is not None:
+                    return res
+        for v in data.values():
+            res = extract_value(v, keys)
+            if res is not None:
+                return res
+    elif isinstance(data, list):
+        for item in data:
+            res = extract_value(item, keys)
+            if res is not None:
+                return res
+    return None
@@ -0,0 +1,218 @@
+"""
+Health metrics (yesterday) -> NOTION_HEALTH_DB_ID
+
+Steps, body weight, body battery, sleep, training readiness/status,
+resting HR and calories for yesterday, pushed as a single Notion page.
+"""
+
+import datetime
+from collections import Counter
+from .common import (
+    LOCAL_TZ,
+    GRAMS_PER_LB,
+    logger,
+    LazyPformat,
+    fetch_all,
+    run_date,
+    create_page,
+    pages_by_date,
+    missing_properties,
+    last_synced,
+    mark_synced,
+    extract_value,
+    build_properties,
+    notion_title,
+    notion_date_obj_from_iso,
+    notion_number,
+    notion_select,
+)
+
+# ---------------------------
+# TRAINING STATUS MAP
+# ---------------------------
+# Garmin's codes run 0..10 with no gaps, so the code is the index
+TRAINING_STATUS_MAP = (
+    "No Status",     # 0
+    "Detraining",    # 1
+    "?",             # 2
+    "Peaking",       # 3
+    "Maintaining",   # 4
+    "Recovery",      # 5
+    "Unproductive",  # 6
+    "Productive",    # 7
+    "Strained",      # 8
+    "Overreaching",  # 9
+    "Paused",        # 10
+)
+# the same labels keyed by Garmin's string form (e.g. "NO_STATUS"), casefolded
+TRAINING_STATUS_NAMES = {label.casefold().replace(" ", "_"): label for label in TRAINING_STATUS_MAP}
+
+# ---------------------------
+# Build props
+# ---------------------------
+def build_health_properties(yesterday, yesterday_iso, steps_total, body_weight, bb_min, bb_max, sleep_score,
+                            bed_time_iso, wake_time_iso, training_readiness, training_status_val,
+                            resting_hr, calories):
+    return build_properties((
+        ("Name", notion_title, yesterday.strftime("%m/%d/%Y")),
+        ("Date", notion_date_obj_from_iso, yesterday_iso),
+        ("Steps", notion_number, steps_total),
+        ("Body Weight", notion_number, body_weight),
+        ("Body Battery (Min)", notion_number, bb_min),
+        ("Body Battery (Max)", notion_number, bb_max),
+        ("Sleep Score", notion_number, sleep_score),
+        ("Bedtime", notion_date_obj_from_iso, bed_time_iso),
+        ("Wake Time", notion_date_obj_from_iso, wake_time_iso),
+        ("Training Readiness", notion_number, training_readiness),
+        ("Training Status", notion_select, training_status_val),
+        ("Resting HR", notion_number, resting_hr),
+        ("Calories Burned", notion_number, calories),
+    ))
+
+# ---------------------------
+# SYNC
+# ---------------------------
+def local_iso(timestamp_ms):
+    """Garmin epoch milliseconds -> local ISO datetime, or None."""
+    if not timestamp_ms:
+        return None
+    try:
+        # straight into the local zone, no intermediate UTC datetime
+        return datetime.datetime.fromtimestamp(timestamp_ms / 1000, tz=LOCAL_TZ).isoformat()
+    except Exception:
+        return None
+
+def report_day():
+    return run_date() - datetime.timedelta(days=1)
+
+def up_to_date(database_id):
+    """True if this machine already wrote a complete page for yesterday."""
+    return last_synced(database_id) == report_day().isoformat()
+
+def garmin_jobs(garmin):
+    """Independent Garmin fetches for yesterday's health page, in fetch_all form."""
+    day = report_day().isoformat()
+    # the daily summary already carries steps, body battery low/high, resting HR
+    # and calories. It is fetched apart from the weigh-ins (get_stats_and_body
+    # would make the same two calls back to back) so both overlap in fetch_all.
+    return {
+        "sleep_data": (garmin.get_sleep_data, (day,)),
+        "readiness": (garmin.get_training_readiness, (day,)),
+        "status": (garmin.get_training_status, (day,)),
+        "stats": (garmin.get_stats, (day,)),
+        "body_comp": (garmin.get_body_composition, (day,)),
+    }
+
+def sync_health(garmin, notion, database_id, fetched=None):
+    yesterday = report_day()
+    day = yesterday.isoformat()
+    logger.info(f"📅 Collecting Garmin health data for {day}")
+
+    results = fetched if fetched is not None else fetch_all(garmin_jobs(garmin))
+    sleep_data = results["sleep_data"] or {}
+    readiness = results["readiness"] or []
+    status = results["status"] or []
+    stats = results["stats"] or []
+    body_comp = results["body_comp"] or {}
+    stats_obj = stats[0] if isinstance(stats, list) and stats else stats if isinstance(stats, dict) else {}
+    body_avg = body_comp.get("totalAverage") if isinstance(body_comp, dict) else None
+
+    steps_total = stats_obj.get("totalSteps")
+    body_weight = None
+    try:
+        w = body_avg.get("weight") if isinstance(body_avg, dict) else None
+        if w:
+            body_weight = round(float(w) / GRAMS_PER_LB, 2)
+    except Exception:
+        body_weight = None
+
+    sleep_daily = sleep_data.get("dailySleepDTO", {}) if sleep_data else {}
+    sleep_score = ((sleep_daily.get("sleepScores") or {}).get("overall") or {}).get("value") or None
+    bed_ts = sleep_daily.get("sleepStartTimestampGMT")
+    wake_ts = sleep_daily.get("sleepEndTimestampGMT")
+    bed_iso = local_iso(bed_ts)
+    wake_iso = local_iso(wake_ts)
+
+    # readiness is a list of entries for the day, newest first; fall back to a
+    # key search only if that shape ever changes
+    readiness_obj = readiness[0] if isinstance(readiness, list) and readiness and isinstance(readiness[0], dict) else {}
+    training_readiness = readiness_obj.get("score") or extract_value(readiness, ["score", "trainingReadinessScore", "unknown_0"]) or None
+    # the status normally sits at mostRecentTrainingStatus.latestTrainingStatusData
+    # .<deviceId>.trainingStatus; walk to it once and only fall back to the key
+    # search for other shapes
+    latest = ((status.get("mostRecentTrainingStatus") or {}).get("latestTrainingStatusData") or {}) if isinstance(status, dict) else {}
+    current_status_val = next((device.get("trainingStatus") for device in latest.values()
+                               if isinstance(device, dict) and device.get("trainingStatus") is not None), None)
+    if current_status_val is None:
+        possible_keys = ["currentStatus", "trainingStatus", "trainingStatusData", "latestTrainingStatusData", "trainingStatusValue"]
+        current_status_val = extract_value(status, possible_keys)
+    logger.debug("Raw training status response (parsed): %s", current_status_val)
+    training_status_val = None
+    if current_status_val is not None:
+        try:
+            if isinstance(current_status_val, (int, float)) or (isinstance(current_status_val, str) and str(current_status_val).isdigit()):
+                code = int(current_status_val)
+                training_status_val = TRAINING_STATUS_MAP[code] if 0 <= code < len(TRAINING_STATUS_MAP) else f"Code {current_status_val}"
+            else:
+                raw_status = str(current_status_val)
+                training_status_val = TRAINING_STATUS_NAMES.get(raw_status.casefold()) or raw_status.replace("_", " ").title()
+        except Exception:
+            training_status_val = str(current_status_val)
+
+    bb_min = stats_obj.get("bodyBatteryLowestValue")
+    bb_max = stats_obj.get("bodyBatteryHighestValue")
+    calories = stats_obj.get("totalKilocalories") or None
+    resting_hr = stats_obj.get("restingHeartRate") or None
+
+    health_props = build_health_properties(
+        yesterday,
+        day,
+        steps_total,
+        body_weight,
+        bb_min,
+        bb_max,
+        sleep_score,
+        bed_iso,
+        wake_iso,
+        training_readiness,
+        training_status_val,
+        resting_hr,
+        calories
+    )
+
+    if "Name" not in health_props or "Date" not in health_props:
+        logger.error("Health properties missing required Name or Date; aborting health push")
+        return Counter(failed=1)
+    if up_to_date(database_id):
+        logger.info("⏭️ Health metrics for yesterday already logged")
+        return Counter(skipped=1)
+    # a failed endpoint leaves its fields empty; keep the day open so a later run can fill them in
+    complete = all(result is not None for result in results.values())
+    try:
+        existing = pages_by_date(notion, database_id, day).get(day)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not check Notion for an existing health page: {e}")
+        existing = None
+    counts = Counter()
+    try:
+        if existing:
+            # one page per day: merge new values into it rather than adding a second row
+            missing = missing_properties(existing, health_props)
+            if missing:
+                notion.pages.update(page_id=existing["id"], properties=missing)
+                counts["updated"] += 1
+                logger.info(f"✅ Filled in {len(missing)} health metrics on yesterday's page")
+            else:
+                counts["skipped"] += 1
+                logger.info("⏭️ Health metrics for yesterday already logged")
+        else:
+            create_page(notion, database_id, health_props)
+            counts["created"] += 1
+            logger.info("✅ Synced health metrics (yesterday)")
+        if complete:
+            mark_synced(database_id, day)
+    except Exception as e:
+        counts["failed"] += 1
+        logger.error(f"⚠️ Failed to push health metrics: {e}")
+        logger.debug("%s", LazyPformat(health_props))
+    return counts
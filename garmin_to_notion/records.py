@@ -0,0 +1,370 @@
+"""
+Personal records -> NOTION_PR_DB_ID
+
+New records are written with PR checked; a superseded record is kept but
+unchecked so the history stays in Notion.
+"""
+
+from collections import Counter
+from .common import logger, LazyPformat, fetch_all, run_concurrently
+
+def get_icon_for_record(activity_name):
+    icon_map = {
+        "1K": "🥇",
+        "1mi": "⚡",
+        "5K": "👟",
+        "10K": "⭐",
+        "Longest Run": "🏃",
+        "Longest Ride": "🚴",
+        "Total Ascent": "🚵",
+        "Max Avg Power (20 min)": "🔋",
+        "Most Steps in a Day": "👣",
+        "Most Steps in a Week": "🚶",
+        "Most Steps in a Month": "📅",
+        "Longest Goal Streak": "✔️",
+        "Other": "🏅"
+    }
+    return icon_map.get(activity_name, "🏅")  # Default to "Other" icon if not found
+
+def get_cover_for_record(activity_name):
+    cover_map = {
+        "1K": "https://images.unsplash.com/photo-1526676537331-7747bf8278fc?ixlib=rb-4.0.3&q=85&fm=jpg&crop=entropy&cs=srgb&w=4800",
+        "1mi": "https://images.unsplash.com/photo-1638183395699-2c0db5b6afbb?ixlib=rb-4.0.3&q=85&fm=jpg&crop=entropy&cs=srgb&w=4800",
+        "5K": "https://images.unsplash.com/photo-1571008887538-b36bb32f4571?ixlib=rb-4.0.3&q=85&fm=jpg&crop=entropy&cs=srgb&w=4800",
+        "10K": "https://images.unsplash.com/photo-1529339944280-1a37d3d6fa8c?ixlib=rb-4.0.3&q=85&fm=jpg&crop=entropy&cs=srgb&w=4800",
+        "Longest Run": "https://images.unsplash.com/photo-1532383282788-19b341e3c422?ixlib=rb-4.0.3&q=85&fm=jpg&crop=entropy&cs=srgb&w=4800",
+        "Longest Ride": "https://images.unsplash.com/photo-1471506480208-91b3a4cc78be?ixlib=rb-4.0.3&q=85&fm=jpg&crop=entropy&cs=srgb&w=4800",
+        "Max Avg Power (20 min)": "https://images.unsplash.com/photo-1591741535018-d042766c62eb?crop=entropy&cs=tinysrgb&fit=max&fm=jpg&ixid=M3w2MzkyMXwwfDF8c2VhcmNofDJ8fHNwaW5uaW5nfGVufDB8fHx8MTcyNjM1Mzc0Mnww&ixlib=rb-4.0.3&q=80&w=4800",
+        "Most Steps in a Day": "https://images.unsplash.com/photo-1476480862126-209bfaa8edc8?ixlib=rb-4.0.3&q=85&fm=jpg&crop=entropy&cs=srgb&w=4800",
+        "Most Steps in a Week": "https://images.unsplash.com/photo-1602174865963-9159ed37e8f1?ixlib=rb-4.0.3&q=85&fm=jpg&crop=entropy&cs=srgb&w=4800",
+        "Most Steps in a Month": "https://images.unsplash.com/photo-1580058572462-98e2c0e0e2f0?ixlib=rb-4.0.3&q=85&fm=jpg&crop=entropy&cs=srgb&w=4800",
+        "Longest Goal Streak": "https://images.unsplash.com/photo-1477332552946-cfb384aeaf1c?ixlib=rb-4.0.3&q=85&fm=jpg&crop=entropy&cs=srgb&w=4800"
+    }
+    return cover_map.get(activity_name, "https://images.unsplash.com/photo-1471506480208-91b3a4cc78be?ixlib=rb-4.0.3&q=85&fm=jpg&crop=entropy&cs=srgb&w=4800") 
+
+def format_activity_type(activity_type):
+    if activity_type is None:
+        return "Walking"
+    return activity_type.replace('_', ' ').title()
+
+def format_activity_name(activity_name):
+    if not activity_name or activity_name is None:
+        return "Unnamed Activity"
+    return activity_name
+
+def format_garmin_value(value, activity_type, typeId):
+    if typeId  == 1:  # 1K
+        total_seconds = round(value)  # Round to the nearest second
+        minutes = total_seconds // 60
+        seconds = total_seconds % 60
+        formatted_value = f"{minutes}:{seconds:02d} /km"
+        pace = formatted_value  # For these types, the value is the pace
+        return formatted_value, pace
+
+    if typeId  == 2:  # 1mile
+        total_seconds = round(value)  # Round to the nearest second
+        minutes = total_seconds // 60
+        seconds = total_seconds % 60
+        formatted_value = f"{minutes}:{seconds:02d}"
+        total_pseconds = total_seconds / 1.60934  # Divide by 1.60934 to get pace per km
+        pminutes = int(total_pseconds // 60)      # Convert to integer
+        pseconds = int(total_pseconds % 60)       # Convert to integer
+        formatted_pace = f"{pminutes}:{pseconds:02d} /km"
+        return formatted_value, formatted_pace
+
+    if typeId == 3:  # 5K
+        total_seconds = round(value) 
+        minutes = total_seconds // 60
+        seconds = total_seconds % 60
+        formatted_value = f"{minutes}:{seconds:02d}"
+        total_pseconds = total_seconds // 5  # Divide by 5km
+        pminutes = total_pseconds // 60
+        pseconds = total_pseconds % 60
+        formatted_pace = f"{pminutes}:{pseconds:02d} /km"
+        return formatted_value, formatted_pace
+
+    if typeId == 4:  # 10K
+        # Round to the nearest second
+        total_seconds = round(value)
+        hours = total_seconds // 3600
+        minutes = (total_seconds % 3600) // 60
+        seconds = total_seconds % 60
+        if hours > 0:
+            formatted_value = f"{hours}:{minutes:02d}:{seconds:02d}"
+        else:
+            formatted_value = f"{minutes}:{seconds:02d}"
+        total_pseconds = total_seconds // 10  # Divide by 10km
+        phours = total_pseconds // 3600
+        pminutes = (total_pseconds % 3600) // 60
+        pseconds = total_pseconds % 60
+        formatted_pace = f"{pminutes}:{pseconds:02d} /km"
+        return formatted_value, formatted_pace
+
+    if typeId in [7, 8]:  # Longest Run, Longest Ride
+        value_km = value / 1000
+        formatted_value = f"{value_km:.2f} km"
+        pace = ""  # No pace for these types
+        return formatted_value, pace
+
+    if typeId == 9:  # Total Ascent
+        value_m = int(value)
+        formatted_value = f"{value_m:,} m"
+        pace = ""
+        return formatted_value, pace
+
+    if typeId == 10:  # Max Avg Power
+        value_w = round(value)
+        formatted_value = f"{value_w} W"
+        pace = ""
+        return formatted_value, pace
+
+    if typeId in [12, 13, 14]:  # Step counts
+        value_steps = round(value)
+        formatted_value = f"{value_steps:,}"
+        pace = ""
+        return formatted_value, pace
+
+    if typeId == 15:  # Longest Goal Streak
+        value_days = round(value)
+        formatted_value = f"{value_days} days"
+        pace = ""
+        return formatted_value, pace
+
+    # Default case
+    if int(value // 60) < 60:  # If total time is less than an hour
+        minutes = int(value // 60)
+        seconds = round((value / 60 - minutes) * 60, 2)
+        formatted_value = f"{minutes}:{seconds:05.2f}"
+    else:  # If total time is one hour or more
+        hours = int(value // 3600)
+        minutes = int((value % 3600) // 60)
+        seconds = round(value % 60, 2)
+        formatted_value = f"{hours}:{minutes:02}:{seconds:05.2f}"
+    
+    pace = ""
+    return formatted_value, pace
+
+def replace_activity_name_by_typeId(typeId):
+    typeId_name_map = {
+        1: "1K",
+        2: "1mi",
+        3: "5K",
+        4: "10K",
+        7: "Longest Run",
+        8: "Longest Ride",
+        9: "Total Ascent",
+        10: "Max Avg Power (20 min)",
+        12: "Most Steps in a Day",
+        13: "Most Steps in a Week",
+        14: "Most Steps in a Month",
+        15: "Longest Goal Streak"
+    }
+    return typeId_name_map.get(typeId, "Unnamed Activity")
+
+RECORDS_NEWEST_FIRST = [{"property": "Date", "direction": "descending"}]
+
+NOTION_MAX_FILTER_CONDITIONS = 100
+
+def preload_records(client, database_id, names=None):
+    """
+    Read the PR database (only the rows named in names, if given) in one
+    paginated query and index it the way sync_records looks records up, so
+    existence checks are dict lookups:
+     - current: record name -> page with PR checked
+     - by_date: (record name, YYYY-MM-DD) -> page
+    """
+    # restrict the scan to the record names being synced (one "or" filter)
+    name_filter = None
+    if names and len(names) <= NOTION_MAX_FILTER_CONDITIONS:
+        name_filter = {"or": [{"property": "Record", "title": {"equals": name}} for name in sorted(names)]}
+    current = {}
+    by_date = {}
+    start_cursor = None
+    while True:
+        kwargs = {"start_cursor": start_cursor} if start_cursor else {}
+        if name_filter:
+            kwargs["filter"] = name_filter
+        # newest first, so setdefault keeps the latest row if a name was checked twice
+        query = client.databases.query(database_id=database_id, page_size=100,
+                                       sorts=RECORDS_NEWEST_FIRST, **kwargs)
+        for page in query['results']:
+            props = page['properties']
+            name = "".join(t.get('plain_text', '') for t in props.get('Record', {}).get('title', []))
+            start = ((props.get('Date') or {}).get('date') or {}).get('start')
+            if start:
+                by_date.setdefault((name, start[:10]), page)
+            if (props.get('PR') or {}).get('checkbox'):
+                current.setdefault(name, page)
+        if not query.get('has_more'):
+            return current, by_date
+        start_cursor = query.get('next_cursor')
+
+def _rich_text_value(prop):
+    return "".join(t.get('plain_text') or t.get('text', {}).get('content', '') for t in (prop or {}).get('rich_text', []))
+
+def record_needs_update(page, value, pace):
+    """
+    Whether the row already written for this record and date differs from Garmin.
+
+    PRs rarely change, so most runs find every row current and write nothing.
+    """
+    props = page['properties']
+    return bool(
+        not (props.get('PR') or {}).get('checkbox')
+        or (value and _rich_text_value(props.get('Value')) != value)
+        or (pace and _rich_text_value(props.get('Pace')) != pace)
+    )
+
+def record_properties(activity_date, value, pace, is_pr):
+    # Shared by update_record and write_new_record
+    properties = {
+        "Date": {"date": {"start": activity_date}},
+        "PR": {"checkbox": is_pr}
+    }
+    if value:
+        properties["Value"] = {"rich_text": [{"text": {"content": value}}]}
+    if pace:
+        properties["Pace"] = {"rich_text": [{"text": {"content": pace}}]}
+    return properties
+
+def record_decoration(activity_name):
+    return {
+        "icon": {"emoji": get_icon_for_record(activity_name)},
+        "cover": {"type": "external", "external": {"url": get_cover_for_record(activity_name)}},
+    }
+
+def update_record(client, page_id, activity_date, value, pace, activity_name, is_pr=True):
+    """Rewrite an existing record row; returns the updated page."""
+    return client.pages.update(
+        page_id=page_id,
+        properties=record_properties(activity_date, value, pace, is_pr),
+        **record_decoration(activity_name)
+    )
+
+def write_new_record(client, database_id, activity_date, activity_type, activity_name, typeId, value, pace):
+    """Create a record row with PR checked; returns the new page."""
+    properties = record_properties(activity_date, value, pace, True)
+    properties.update({
+        "Activity Type": {"select": {"name": activity_type}},
+        "Record": {"title": [{"text": {"content": activity_name}}]},
+        "typeId": {"number": typeId},
+    })
+
+    return client.pages.create(
+        parent={"database_id": database_id},
+        properties=properties,
+        **record_decoration(activity_name)
+    )
+
+def latest_record_per_type(records):
+    """
+    Collapse the Garmin PR list to one record per typeId (the most recent).
+
+    Older entries of the same type would only be archived again by the sync,
+    so pushing them costs Notion calls for nothing.
+    """
+    latest = {}
+    for record in records:
+        type_id = record.get('typeId')
+        if type_id == 16:
+            continue
+        current = latest.get(type_id)
+        if current is None or (record.get('prStartTimeGmt') or 0) > (current.get('prStartTimeGmt') or 0):
+            latest[type_id] = record
+    return list(latest.values())
+
+def garmin_jobs(garmin):
+    return {"records": (garmin.get_personal_record, ())}
+
+def sync_records(garmin, notion, database_id, fetched=None):
+    results = fetched if fetched is not None else fetch_all(garmin_jobs(garmin))
+    records = results["records"] or []
+    filtered_records = latest_record_per_type(records)
+    counts = Counter()
+    if not filtered_records:
+        return counts
+    # one scan of the PR database instead of two queries per record
+    names = {replace_activity_name_by_typeId(record.get('typeId')) for record in filtered_records}
+    current_prs, records_by_date = preload_records(notion, database_id, names)
+
+    def sync_record(record):
+        activity_date = record.get('prStartTimeGmtFormatted')
+        activity_type = format_activity_type(record.get('activityType'))
+        activity_name = replace_activity_name_by_typeId(record.get('typeId'))
+        typeId = record.get('typeId', 0)
+        value, pace = format_garmin_value(record.get('value', 0), activity_type, typeId)
+
+        existing_pr_record = current_prs.get(activity_name)
+        existing_date_record = records_by_date.get((activity_name, (activity_date or "")[:10]))
+
+        def written(page):
+            # several typeIds share a name (e.g. "Unnamed Activity"), so the next
+            # record with this name must see this write, not the preloaded page
+            current_prs[activity_name] = page
+            records_by_date[activity_name, (activity_date or "")[:10]] = page
+
+        if existing_date_record:
+            if not record_needs_update(existing_date_record, value, pace):
+                return "skipped"
+            written(update_record(notion, existing_date_record['id'], activity_date, value, pace, activity_name, True))
+            logger.info(f"🔁 Updated existing record: {activity_type} - {activity_name}")
+            return "updated"
+        elif existing_pr_record:
+            # Add error handling here
+            try:
+                date_prop = existing_pr_record['properties']['Date']
+                if date_prop and date_prop.get('date') and date_prop['date'].get('start'):
+                    existing_date = date_prop['date']['start']
+                    
+                    if activity_date > existing_date:
+                        # create before archiving, so a failed write leaves the old PR current
+                        written(write_new_record(notion, database_id, activity_date, activity_type, activity_name, typeId, value, pace))
+                        logger.info(f"✅ Created new PR record: {activity_type} - {activity_name}")
+
+                        update_record(notion, existing_pr_record['id'], existing_date, None, None, activity_name, False)
+                        logger.info(f"🗄️ Archived old record: {activity_type} - {activity_name}")
+                        return "created"
+                    else:
+                        logger.info(f"⏭️ No update needed: {activity_type} - {activity_name}")
+                        return "skipped"
+                else:
+                    # Handle case where date is missing or improperly formatted
+                    logger.warning(f"⚠️ Record {activity_name} has invalid date format - updating anyway")
+                    written(update_record(notion, existing_pr_record['id'], activity_date, value, pace, activity_name, True))
+                    return "updated"
+            except (KeyError, TypeError) as e:
+                logger.error(f"⚠️ Error processing record {activity_name}: {e}")
+                logger.debug("Record data: %s", LazyPformat(existing_pr_record['properties']))
+                # Fallback - create new record if we can't process the existing one properly
+                written(write_new_record(notion, database_id, activity_date, activity_type, activity_name, typeId, value, pace))
+                return "created"
+        else:
+            written(write_new_record(notion, database_id, activity_date, activity_type, activity_name, typeId, value, pace))
+            logger.info(f"✅ Successfully written new record: {activity_type} - {activity_name}")
+            return "created"
+
+    # unmapped typeIds share a name (and so a Notion row), so records are only
+    # independent across names: each name's records run in date order on one
+    # worker, seeing each other's writes, and the names overlap
+    groups = {}
+    for record in sorted(filtered_records, key=lambda r: r.get('prStartTimeGmt') or 0):
+        groups.setdefault(replace_activity_name_by_typeId(record.get('typeId')), []).append(record)
+
+    def sync_group(name):
+        results = []
+        for record in groups[name]:
+            try:
+                results.append((sync_record(record), None))
+            except Exception as e:
+                results.append((None, e))
+        return results
+
+    # a failed Notion write raises out of sync_record and is counted here
+    for name, group_results, _ in run_concurrently(sync_group, list(groups)):
+        for outcome, error in group_results:
+            if error is not None:
+                counts["failed"] += 1
+                logger.error(f"⚠️ Error writing record {name}: {error}")
+            else:
+                counts[outcome] += 1
+    return counts
@@ -0,0 +1,98 @@
+"""
+Sleep (last night) -> NOTION_SLEEP_DB_ID
+"""
+
+from datetime import datetime, timezone
+from collections import Counter
+import pytz
+from .common import logger, fetch_all, run_date, pages_by_date, last_synced, mark_synced
+
+# the sleep "Times" strings have always been written in Eastern time, unlike
+# the other flows' LOCAL_TZ; kept so new rows read like the existing ones
+SLEEP_TZ = pytz.timezone("America/New_York")
+
+def up_to_date(database_id):
+    """True if this machine already wrote last night's sleep page."""
+    return last_synced(database_id) == run_date().isoformat()
+
+def garmin_jobs(garmin):
+    return {"sleep": (garmin.get_sleep_data, (run_date().isoformat(),))}
+
+def format_duration(seconds):
+    minutes = (seconds or 0) // 60
+    return f"{minutes // 60}h {minutes % 60}m"
+
+def format_time(timestamp):
+    return (
+        datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        if timestamp else None
+    )
+
+def format_time_readable(timestamp):
+    return (
+        datetime.fromtimestamp(timestamp / 1000, SLEEP_TZ).strftime("%H:%M")
+        if timestamp else "Unknown"
+    )
+
+def format_date_for_name(sleep_date):
+    # YYYY-MM-DD -> DD.MM.YYYY without a strptime/strftime round trip
+    return f"{sleep_date[8:10]}.{sleep_date[5:7]}.{sleep_date[:4]}" if sleep_date else "Unknown"
+
+def create_sleep_data(client, database_id, sleep_data, skip_zero_sleep=True):
+    daily_sleep = sleep_data.get('dailySleepDTO', {})
+    if not daily_sleep:
+        return
+    
+    sleep_date = daily_sleep.get('calendarDate', "Unknown Date")
+    # read each field once; the properties below use every one of them twice
+    light = daily_sleep.get('lightSleepSeconds') or 0
+    deep = daily_sleep.get('deepSleepSeconds') or 0
+    rem = daily_sleep.get('remSleepSeconds') or 0
+    awake = daily_sleep.get('awakeSleepSeconds') or 0
+    start_ts = daily_sleep.get('sleepStartTimestampGMT')
+    end_ts = daily_sleep.get('sleepEndTimestampGMT')
+    total_sleep = deep + light + rem
+    
+    
+    if skip_zero_sleep and total_sleep == 0:
+        logger.info(f"⏭️ Skipping sleep data for {sleep_date} as total sleep is 0")
+        return
+
+    properties = {
+        "Date": {"title": [{"text": {"content": format_date_for_name(sleep_date)}}]},
+        "Times": {"rich_text": [{"text": {"content": f"{format_time_readable(start_ts)} → {format_time_readable(end_ts)}"}}]},
+        "Long Date": {"date": {"start": sleep_date}},
+        "Full Date/Time": {"date": {"start": format_time(start_ts), "end": format_time(end_ts)}},
+        "Total Sleep (h)": {"number": round(total_sleep / 3600, 1)},
+        "Light Sleep (h)": {"number": round(light / 3600, 1)},
+        "Deep Sleep (h)": {"number": round(deep / 3600, 1)},
+        "REM Sleep (h)": {"number": round(rem / 3600, 1)},
+        "Awake Time (h)": {"number": round(awake / 3600, 1)},
+        "Total Sleep": {"rich_text": [{"text": {"content": format_duration(total_sleep)}}]},
+        "Light Sleep": {"rich_text": [{"text": {"content": format_duration(light)}}]},
+        "Deep Sleep": {"rich_text": [{"text": {"content": format_duration(deep)}}]},
+        "REM Sleep": {"rich_text": [{"text": {"content": format_duration(rem)}}]},
+        "Awake Time": {"rich_text": [{"text": {"content": format_duration(awake)}}]},
+        "Resting HR": {"number": sleep_data.get('restingHeartRate', 0)}
+    }
+    
+    client.pages.create(parent={"database_id": database_id}, properties=properties, icon={"emoji": "😴"})
+    logger.info(f"✅ Created sleep entry for: {sleep_date}")
+    return True
+
+def sync_sleep(garmin, notion, database_id, fetched=None):
+    results = fetched if fetched is not None else fetch_all(garmin_jobs(garmin))
+    data = results["sleep"]
+    counts = Counter()
+    if data:
+        sleep_date = data.get('dailySleepDTO', {}).get('calendarDate')
+        # the state file answers "already synced?" without a Notion query on repeat runs
+        if not sleep_date or last_synced(database_id) == sleep_date:
+            counts["skipped"] += 1
+        elif sleep_date in pages_by_date(notion, database_id, sleep_date, date_prop="Long Date"):
+            counts["skipped"] += 1
+            mark_synced(database_id, sleep_date)
+        elif create_sleep_data(notion, database_id, data, skip_zero_sleep=True):
+            counts["created"] += 1
+            mark_synced(database_id, sleep_date)
+    return counts
@@ -0,0 +1,83 @@
+"""
+Daily steps -> NOTION_STEPS_DB_ID (create or update)
+"""
+
+from datetime import timedelta
+from collections import Counter
+from .common import fetch_all, run_date, day_args, pages_by_date
+
+WALKING_FILTER = {"property": "Activity Type", "title": {"equals": "Walking"}}
+
+def garmin_jobs(garmin):
+    """
+    Fetch jobs for the last x days of daily step count data from Garmin Connect,
+    one per day so the days are fetched concurrently.
+    """
+    today = run_date()
+    startdate = today - timedelta(days=1)
+    daterange = [startdate + timedelta(days=x) 
+                 for x in range((today - startdate).days)] # excl. today
+    return {d.isoformat(): (garmin.get_daily_steps, day_args(garmin.get_daily_steps, d.isoformat())) for d in daterange}
+
+def steps_need_update(existing_steps, new_properties):
+    """
+    Compare an existing daily steps page with the properties build_steps_properties
+    produced for it, so days that have not changed are not rewritten.
+    """
+    existing_props = existing_steps['properties']
+    activity_type = "".join(t.get('plain_text') or t.get('text', {}).get('content', '')
+                            for t in (existing_props.get('Activity Type') or {}).get('title', []))
+    
+    return (
+        any((existing_props.get(name) or {}).get('number') != prop['number']
+            for name, prop in new_properties.items() if 'number' in prop) or
+        activity_type != "Walking"
+    )
+
+def build_steps_properties(steps):
+    total_distance = steps.get('totalDistance')
+    if total_distance is None:
+        total_distance = 0
+    return {
+        "Activity Type": {"title": [{"text": {"content": "Walking"}}]},
+        "Total Steps": {"number": steps.get('totalSteps')},
+        "Step Goal": {"number": steps.get('stepGoal')},
+        "Total Distance (km)": {"number": round(total_distance / 1000, 2)}
+    }
+
+def update_daily_steps(client, existing_steps, properties):
+    """
+    Update an existing daily steps entry in the Notion database with new data.
+    """
+    client.pages.update(page_id=existing_steps['id'], properties=properties)
+
+def create_daily_steps(client, database_id, steps):
+    """
+    Create a new daily steps entry in the Notion database.
+    """
+    properties = build_steps_properties(steps)
+    properties["Date"] = {"date": {"start": steps.get('calendarDate')}}
+    client.pages.create(parent={"database_id": database_id}, properties=properties)
+
+def sync_steps(garmin, notion, database_id, fetched=None):
+    results = fetched if fetched is not None else fetch_all(garmin_jobs(garmin))
+    daily_steps = [steps for day in sorted(results) for steps in results[day] or []]
+    counts = Counter()
+    if not daily_steps:
+        return counts
+    # one query for the whole range instead of one per day
+    existing = pages_by_date(notion, database_id, min(results), extra_filter=WALKING_FILTER)
+    for steps in daily_steps:
+        steps_date = steps.get('calendarDate')
+        existing_steps = existing.get(steps_date)
+        if existing_steps:
+            properties = build_steps_properties(steps)
+            if steps_need_update(existing_steps, properties):
+                update_daily_steps(notion, existing_steps, properties)
+                counts["updated"] += 1
+            else:
+                counts["skipped"] += 1
+        else:
+            create_daily_steps(notion, database_id, steps)
+            counts["created"] += 1
+    return counts